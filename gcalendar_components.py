@@ -1,9 +1,355 @@
 from xai_components.base import InArg, OutArg, Component, xai_component, InCompArg
 from googleapiclient.discovery import build
 from google.oauth2 import service_account
+from google.auth.transport.requests import AuthorizedSession, Request
+from google_auth_httplib2 import AuthorizedHttp
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import quote
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import httplib2
+import httpx
 import base64
+import datetime
+import functools
 import json
 import os
+import re
+import threading
+import time
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+SCOPES = ['https://www.googleapis.com/auth/calendar']
+
+# Built services keyed on their credentials source, so repeated authentication
+# skips re-reading credentials and rebuilding the discovery client. Tokens are
+# refreshed in the background, so the TTL only bounds how long an idle entry and
+# its refresher are kept.
+_SERVICE_CACHE: dict = {}
+_SERVICE_CACHE_TTL = 12 * 60 * 60
+_SERVICE_CACHE_LOCK = threading.Lock()
+
+# Service account credentials decoded from GOOGLE_SERVICE_ACCOUNT_CREDENTIALS, as (encoded_json, Credentials).
+_ENV_CREDENTIALS = None
+_ENV_CREDENTIALS_LOCK = threading.Lock()
+
+CALENDAR_API_URL = 'https://www.googleapis.com/calendar/v3'
+
+# Shared worker pool for fanning out blocking Calendar calls, created on first use by _get_executor().
+_EXECUTOR = None
+_EXECUTOR_LOCK = threading.Lock()
+DEFAULT_WORKERS = 16
+
+# Partial-response selector covering only the fields read by _project_event.
+EVENT_LIST_FIELDS = "items(summary,start,end,location,attendees/email,hangoutLink),nextPageToken"
+MAX_EVENTS_PER_PAGE = 2500
+
+# RFC 3339 date-time as accepted by the Calendar API, e.g. 2024-01-31T09:30:00Z or 2024-01-31T09:30:00+08:00.
+_ISO_RE = re.compile(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?(Z|[+-]\d{2}:\d{2})?', re.IGNORECASE)
+
+# Opt-in on-disk HTTP cache directory; lets unchanged GET responses be revalidated with ETags as 304s.
+HTTP_CACHE_DIR_ENV = 'GCAL_HTTP_CACHE_DIR'
+
+
+def _project_event(event):
+    """Reduce a Calendar API event resource to the fields exposed by the event components."""
+    hangout_link = event.get('hangoutLink') or ''
+    start = event['start']
+    end = event['end']
+    attendees = event.get('attendees')
+    return {
+        "event_name": event.get('summary', 'No Title'),
+        "start_time": start.get('dateTime') or start.get('date'),
+        "end_time": end.get('dateTime') or end.get('date'),
+        "location": event.get('location', ''),
+        # Attendees such as resources or phone-only guests may have no email.
+        "participants": [participant['email'] for participant in attendees if 'email' in participant] if attendees else [],
+        "gmeet_link": hangout_link,
+        # The meeting ID is the last path segment of the Google Meet URL.
+        "meeting_id": hangout_link.rpartition('/')[2] if hangout_link else None
+    }
+
+
+def _build_event_body(spec):
+    """Build a Calendar API event body from a flat event spec, skipping missing fields."""
+    body = {}
+    if spec.get('summary'):
+        body['summary'] = spec['summary']
+    if spec.get('description'):
+        body['description'] = spec['description']
+    if spec.get('start_time'):
+        body['start'] = {'dateTime': spec['start_time'], 'timeZone': 'UTC'}
+    if spec.get('end_time'):
+        body['end'] = {'dateTime': spec['end_time'], 'timeZone': 'UTC'}
+    if spec.get('location'):
+        body['location'] = spec['location']
+    if spec.get('participants'):
+        body['attendees'] = [{'email': participant} for participant in spec['participants']]
+    return body
+
+
+def _check_datetime(name, value):
+    """Raise ValueError if `value` is not an RFC 3339 date-time, before any request is sent."""
+    if not value or not _ISO_RE.fullmatch(value):
+        raise ValueError(f"{name} must be an RFC 3339 date-time such as 2024-01-31T09:30:00Z, got {value!r}.")
+
+
+def _check_event_spec(name, spec):
+    """Raise ValueError if a new-event spec lacks a summary or valid start and end times."""
+    if not spec.get('summary'):
+        raise ValueError(f"{name} must have a summary.")
+    _check_datetime(f"{name}.start_time", spec.get('start_time'))
+    _check_datetime(f"{name}.end_time", spec.get('end_time'))
+
+
+def _check_event_id(value):
+    """Raise ValueError if no event ID was provided, before any request is sent."""
+    if not value:
+        raise ValueError("An event_id must be provided.")
+
+
+@functools.lru_cache(maxsize=32)
+def _load_file_credentials(path, mtime):
+    """Load service account Credentials from a JSON file, once per path and modification time."""
+    return service_account.Credentials.from_service_account_file(path, scopes=SCOPES)
+
+
+def _load_env_credentials(encoded_json):
+    """Decode the base64 service account JSON once and reuse the resulting Credentials."""
+    global _ENV_CREDENTIALS
+    with _ENV_CREDENTIALS_LOCK:
+        if _ENV_CREDENTIALS is None or _ENV_CREDENTIALS[0] != encoded_json:
+            gcal_creds = _json_loads(base64.b64decode(encoded_json))
+            credentials = service_account.Credentials.from_service_account_info(gcal_creds, scopes=SCOPES)
+            _ENV_CREDENTIALS = (encoded_json, credentials)
+        return _ENV_CREDENTIALS[1]
+
+
+class GCalCtx:
+    """The Google Calendar clients shared by all components, stored in the context under `gcal`.
+
+    The pooled `session` for raw REST calls and the `http2` client are only built on first use.
+    """
+    __slots__ = ('service', 'events', 'credentials', 'default_calendar_id', '_session', '_http2', '_lock')
+
+    def __init__(self, service, credentials, default_calendar_id="primary"):
+        self.service = service
+        # service.events() builds a new Resource from the discovery document on every call.
+        self.events = service.events()
+        self.credentials = credentials
+        self.default_calendar_id = default_calendar_id
+        self._session = None
+        self._http2 = None
+        self._lock = threading.Lock()
+
+    @property
+    def session(self):
+        if self._session is None:
+            if self.credentials is None:
+                raise ValueError("This component needs credentials from AuthenticateGoogleCalendar; the service in the context has none.")
+            with self._lock:
+                if self._session is None:
+                    self._session = _build_session(self.credentials)
+        return self._session
+
+    @property
+    def http2(self):
+        with self._lock:
+            if self._http2 is None:
+                self._http2 = _AsyncHTTP2Client()
+        return self._http2
+
+    def close(self):
+        """Close the pooled session and HTTP/2 client, if they were built."""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+            if self._http2 is not None:
+                self._http2.close()
+                self._http2 = None
+
+
+class _AsyncHTTP2Client:
+    """An httpx HTTP/2 client on its own event loop thread, so its connection outlives a single component run.
+
+    Running the loop on a dedicated thread also keeps it clear of any loop already running in the
+    caller's thread, as under Jupyter/ipykernel.
+    """
+
+    def __init__(self):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+        # The client must be created on the loop it will be used from.
+        self.client = self.run(self._create_client())
+
+    @staticmethod
+    async def _create_client():
+        limits = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+        return httpx.AsyncClient(http2=True, limits=limits)
+
+    def run(self, coro):
+        """Run a coroutine on the client's loop and wait for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def close(self):
+        self.run(self.client.aclose())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+def _get_gcal(ctx):
+    """Return the GCalCtx for this context, wrapping a bare `service` set by another authentication flow."""
+    try:
+        gctx = ctx['gcal']
+    except KeyError:
+        return _wrap_service(ctx)
+    if ctx.get('service', gctx.service) is not gctx.service:
+        return _wrap_service(ctx)
+    return gctx
+
+
+def _wrap_service(ctx):
+    """Build and store a GCalCtx around `ctx['service']`."""
+    try:
+        service = ctx['service']
+    except KeyError:
+        raise KeyError("No Google Calendar service in the context; run AuthenticateGoogleCalendar first.") from None
+    # Recover the credentials from the service's authorized transport, if it has one.
+    credentials = getattr(getattr(service, '_http', None), 'credentials', None)
+    gctx = GCalCtx(service, credentials)
+    ctx['gcal'] = gctx
+    return gctx
+
+
+class _TokenRefresher:
+    """Refreshes a Credentials object's access token in the background shortly before it expires.
+
+    Refreshing stops at `deadline` (a `time.monotonic()` value, the expiry of the owning cache
+    entry), when `stop()` is called, or after several consecutive failures; the request path
+    still refreshes on demand after that.
+    """
+
+    LEAD_TIME = 300
+    RETRY_DELAY = 60
+    MAX_FAILURES = 3
+
+    def __init__(self, credentials, deadline):
+        self.credentials = credentials
+        self.deadline = deadline
+        self._timer = None
+        self._stopped = False
+        self._failures = 0
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Schedule the first refresh, or a first check if no token has been fetched yet."""
+        if self.credentials.expiry is None:
+            # The first API call fetches the token; check back once it has had time to do so.
+            self._schedule(self.RETRY_DELAY)
+        else:
+            self._schedule_from_expiry()
+
+    def stop(self):
+        with self._lock:
+            self._stopped = True
+            if self._timer is not None:
+                self._timer.cancel()
+
+    def _schedule(self, delay):
+        with self._lock:
+            if self._stopped or time.monotonic() + delay >= self.deadline:
+                return
+            self._timer = threading.Timer(delay, self._refresh)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _seconds_to_refresh(self):
+        """Seconds until the token is due for refresh; zero or less if it is due now or was never fetched."""
+        if self.credentials.expiry is None:
+            return 0
+        # Credentials.expiry is a naive UTC datetime.
+        now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+        return (self.credentials.expiry - now).total_seconds() - self.LEAD_TIME
+
+    def _schedule_from_expiry(self):
+        self._schedule(max(self._seconds_to_refresh(), self.RETRY_DELAY))
+
+    def _refresh(self):
+        if self._stopped:
+            return
+        if self._seconds_to_refresh() > 0:
+            # The request path already fetched a token that is not yet due for refresh.
+            self._schedule_from_expiry()
+            return
+        try:
+            self.credentials.refresh(Request())
+        except Exception as e:
+            self._failures += 1
+            print(f"Background Google Calendar token refresh failed: {e}")
+            if self._failures < self.MAX_FAILURES:
+                self._schedule(self.RETRY_DELAY)
+            return
+        self._failures = 0
+        self._schedule_from_expiry()
+
+
+def _evict_services(new_key):
+    """Drop cached services that have expired or are superseded by `new_key`, stopping their refreshers.
+
+    Must be called with _SERVICE_CACHE_LOCK held.
+    """
+    now = time.monotonic()
+    for key, (created, gctx, refresher) in list(_SERVICE_CACHE.items()):
+        # Same credentials source and subject, but an older file mtime or env value.
+        superseded = key[0] == new_key[0] and key[2] == new_key[2]
+        if superseded or now - created >= _SERVICE_CACHE_TTL:
+            refresher.stop()
+            gctx.close()
+            del _SERVICE_CACHE[key]
+
+
+def _get_executor():
+    """Return the shared worker pool, sized by the GCAL_WORKERS environment variable."""
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            try:
+                workers = max(int(os.getenv('GCAL_WORKERS', DEFAULT_WORKERS)), 1)
+            except ValueError:
+                print(f"Ignoring invalid GCAL_WORKERS value, using {DEFAULT_WORKERS} workers.")
+                workers = DEFAULT_WORKERS
+            _EXECUTOR = ThreadPoolExecutor(max_workers=workers)
+        return _EXECUTOR
+
+
+def _build_http():
+    """Create the httplib2 transport, with a private on-disk cache if GCAL_HTTP_CACHE_DIR is set."""
+    cache_dir = os.getenv(HTTP_CACHE_DIR_ENV)
+    if cache_dir:
+        cache_dir = os.path.expanduser(cache_dir)
+        try:
+            os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+            return httplib2.Http(cache=cache_dir, timeout=30)
+        except OSError as e:
+            print(f"Google Calendar HTTP cache disabled, could not create {cache_dir}: {e}")
+    return httplib2.Http(timeout=30)
+
+
+def _build_session(credentials):
+    """Create a pooled, retrying requests session signed with the given credentials."""
+    session = AuthorizedSession(credentials)
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=Retry(total=3, backoff_factor=0.2))
+    session.mount('https://', adapter)
+    return session
 
 @xai_component()
 class AuthenticateGoogleCalendar(Component):
@@ -15,34 +361,66 @@ class AuthenticateGoogleCalendar(Component):
       the component will attempt to read credentials from the `GOOGLE_SERVICE_ACCOUNT_CREDENTIALS` environment variable.
     - `impersonate_user_account` (str, optional): The email address of the user to impersonate. If provided,
       the service account credentials will delegate access to this user account.
+    - `force_refresh` (bool, optional): If True, ignore any cached service and rebuild it.
 
     ## Outputs
-    - Adds `service` (the authenticated Google Calendar service object) to the context for further use by other components.
+    - Adds `gcal` (a `GCalCtx` holding the authenticated Google Calendar service, a pooled `AuthorizedSession`
+      for raw REST calls and the shared credentials, refreshed in the background before expiry) to the context
+      for further use by other components.
+    - Adds `service` (the authenticated Google Calendar service object) to the context for backwards compatibility.
+      Components also accept a context that only has a `service` set by another authentication flow.
     """
     service_account_json: InArg[str]
     impersonate_user_account: InArg[str]
+    force_refresh: InArg[bool]
 
     def execute(self, ctx) -> None:
-        SCOPES = ['https://www.googleapis.com/auth/calendar']
         SERVICE_ACCOUNT_FILE = self.service_account_json.value
-        if SERVICE_ACCOUNT_FILE and os.path.exists(SERVICE_ACCOUNT_FILE):
-            print(f"Using provided service account JSON: {SERVICE_ACCOUNT_FILE}")
-            credentials = service_account.Credentials.from_service_account_file(SERVICE_ACCOUNT_FILE, scopes=SCOPES)
-        else:
+        subject = self.impersonate_user_account.value
+
+        cache_key = None
+        if SERVICE_ACCOUNT_FILE:
+            try:
+                cache_key = (SERVICE_ACCOUNT_FILE, os.path.getmtime(SERVICE_ACCOUNT_FILE), subject)
+            except OSError:
+                pass
+
+        if cache_key is None:
             encoded_json = os.getenv("GOOGLE_SERVICE_ACCOUNT_CREDENTIALS")
             if not encoded_json:
                 raise ValueError("Neither a valid file path nor GOOGLE_SERVICE_ACCOUNT_CREDENTIALS environment variable was found.")
-            
-            gcal_creds = json.loads(base64.b64decode(encoded_json).decode())
-            credentials = service_account.Credentials.from_service_account_info(gcal_creds, scopes=SCOPES)
-            
-        if self.impersonate_user_account.value is not None:
-            delegated_credentials = credentials.with_subject(self.impersonate_user_account.value)
-            service = build('calendar', 'v3', credentials=delegated_credentials)
-        else:
-            service = build('calendar', 'v3', credentials=credentials)
-            
-        ctx.update({'service': service})
+            cache_key = ("env", hash(encoded_json), subject)
+
+        # Lookup, eviction and insert happen under one lock so concurrent authentications neither
+        # build duplicate services nor evict an entry another run has just handed out.
+        with _SERVICE_CACHE_LOCK:
+            cached = _SERVICE_CACHE.get(cache_key)
+            if cached and not self.force_refresh.value and time.monotonic() - cached[0] < _SERVICE_CACHE_TTL:
+                gctx = cached[1]
+                ctx.update({'gcal': gctx, 'service': gctx.service})
+                print("Reusing cached Google Calendar service.")
+                return
+
+            if cache_key[0] != "env":
+                print(f"Using provided service account JSON: {SERVICE_ACCOUNT_FILE}")
+                credentials = _load_file_credentials(SERVICE_ACCOUNT_FILE, cache_key[1])
+            else:
+                credentials = _load_env_credentials(encoded_json)
+
+            if subject is not None:
+                credentials = credentials.with_subject(subject)
+
+            # A single long-lived Http object keeps its connection to googleapis.com open between calls.
+            authed_http = AuthorizedHttp(credentials, http=_build_http())
+            service = build('calendar', 'v3', http=authed_http, cache_discovery=False)
+            created = time.monotonic()
+            refresher = _TokenRefresher(credentials, deadline=created + _SERVICE_CACHE_TTL)
+            refresher.start()
+            _evict_services(cache_key)
+            gctx = GCalCtx(service, credentials)
+            _SERVICE_CACHE[cache_key] = (created, gctx, refresher)
+
+        ctx.update({'gcal': gctx, 'service': service})
         print("Google Calendar authentication completed successfully.")
 
 
@@ -67,40 +445,102 @@ class GetGoogleCalendarEvents(Component):
 
     def execute(self, ctx) -> None:
 
-        service = ctx["service"]
-        events_result = service.events().list(
-            calendarId=self.calendar_id.value,
-            timeMin=self.start_time.value,
-            timeMax=self.end_time.value,
-            singleEvents=True
-        ).execute()
-
-        events = events_result.get('items', [])
-        if not events:
+        events = _get_gcal(ctx).events
+        events_list = []
+        page_token = None
+        while True:
+            events_result = events.list(
+                calendarId=self.calendar_id.value,
+                timeMin=self.start_time.value,
+                timeMax=self.end_time.value,
+                singleEvents=True,
+                maxResults=MAX_EVENTS_PER_PAGE,
+                fields=EVENT_LIST_FIELDS,
+                pageToken=page_token
+            ).execute()
+            events_list.extend(_project_event(event) for event in events_result.get('items', []))
+            page_token = events_result.get('nextPageToken')
+            if not page_token:
+                break
+
+        if not events_list:
             self.events.value = {"message": "No events found for the specified time range."}
         else:
-            events_list = []
-            for event in events:
-                event_details = {
-                    "event_name": event.get('summary', 'No Title'),
-                    "start_time": event['start'].get('dateTime', event['start'].get('date')),
-                    "end_time": event['end'].get('dateTime', event['end'].get('date')),
-                    "location": event.get('location', ''),
-                    "participants": [participant['email'] for participant in event.get('attendees', [])],
-                    "gmeet_link": event.get('hangoutLink', ''),
-                    "meeting_id": self.extract_meeting_id(event.get('hangoutLink', ''))
-                }
-                events_list.append(event_details)
-
             self.events.value = {"events": events_list}
 
-
     @staticmethod
     def extract_meeting_id(meet_url):
         """Extract the meeting ID from the Google Meet URL."""
-        if meet_url:
-            return meet_url.split('/')[-1]
-        return None
+        return meet_url.rpartition('/')[2] if meet_url else None
+
+
+@xai_component()
+class BulkGetGoogleCalendarEvents(Component):
+    """
+    A component that concurrently fetches and structures events from several Google Calendars.
+
+    All calendars are queried at once, multiplexed over a single HTTP/2 connection, so the total
+    wait is close to the slowest single request rather than the sum of all of them. The connection
+    is kept on the authenticated context and reused by later runs.
+
+    ## Inputs
+    - `calendar_ids` (list): The IDs of the Google Calendars from which to retrieve events.
+    - `start_time` (str): The start time (in ISO format) for the search range.
+    - `end_time` (str): The end time (in ISO format) for the search range.
+
+    ## Outputs
+    - `events` (dict): A dictionary mapping each calendar ID to a dict with `events` (its list of structured
+      events) and `error` (None on success). A calendar that cannot be read does not affect the others.
+
+    ## Requirements
+    - An authenticated Google Calendar service with credentials (as set by `AuthenticateGoogleCalendar`) must be present in the context.
+    """
+    calendar_ids: InCompArg[list]
+    start_time: InCompArg[str]
+    end_time: InCompArg[str]
+    events: OutArg[dict]
+
+    def execute(self, ctx) -> None:
+
+        gctx = _get_gcal(ctx)
+        credentials = gctx.credentials
+        if credentials is None:
+            raise ValueError("This component needs credentials from AuthenticateGoogleCalendar; the service in the context has none.")
+        if not credentials.valid:
+            credentials.refresh(Request())
+        headers = {'Authorization': f'Bearer {credentials.token}'}
+
+        http2 = gctx.http2
+        results = http2.run(self.fetch_all(http2.client, self.calendar_ids.value, headers))
+        self.events.value = dict(zip(self.calendar_ids.value, results))
+
+    async def fetch_all(self, client, calendar_ids, headers):
+        return await asyncio.gather(*[self.fetch_calendar(client, cal_id, headers) for cal_id in calendar_ids])
+
+    async def fetch_calendar(self, client, calendar_id, headers):
+        try:
+            return {"events": await self.fetch_events(client, calendar_id, headers), "error": None}
+        except Exception as e:
+            return {"events": [], "error": str(e)}
+
+    async def fetch_events(self, client, calendar_id, headers):
+        url = f"{CALENDAR_API_URL}/calendars/{quote(calendar_id, safe='')}/events"
+        params = {
+            'timeMin': self.start_time.value,
+            'timeMax': self.end_time.value,
+            'singleEvents': 'true',
+            'maxResults': MAX_EVENTS_PER_PAGE,
+            'fields': EVENT_LIST_FIELDS
+        }
+        events_list = []
+        while True:
+            response = await client.get(url, params=params, headers=headers)
+            response.raise_for_status()
+            page = _json_loads(response.content)
+            events_list.extend(_project_event(event) for event in page.get('items', []))
+            if 'nextPageToken' not in page:
+                return events_list
+            params['pageToken'] = page['nextPageToken']
 
 
 @xai_component()
@@ -130,9 +570,12 @@ class CreateGoogleCalendarEvent(Component):
     event_id: OutArg[str]
 
     def execute(self, ctx) -> None:
-    
+
+        _check_datetime("start_time", self.start_time.value)
+        _check_datetime("end_time", self.end_time.value)
+
         CALENDAR_ID = self.calendar_id.value
-        service = ctx["service"]
+        events = _get_gcal(ctx).events
 
         event = {
             'summary': self.summary.value,
@@ -150,7 +593,7 @@ class CreateGoogleCalendarEvent(Component):
             attendees = [{'email': participant} for participant in self.participants.value]
             event['attendees'] = attendees
 
-        created_event = service.events().insert(calendarId=CALENDAR_ID, body=event, sendUpdates='all').execute()
+        created_event = events.insert(calendarId=CALENDAR_ID, body=event, sendUpdates='all').execute()
         self.event_id.value = created_event['id']
 
 
@@ -187,10 +630,17 @@ class ModifyGoogleCalendarEvent(Component):
     modified_event_id: OutArg[str]
 
     def execute(self, ctx) -> None:
-        
-        service = ctx["service"]
-        cal_id = self.calendar_id.value if self.calendar_id.value else "primary"
-        event = service.events().get(calendarId=cal_id, eventId=self.event_id.value).execute()
+
+        _check_event_id(self.event_id.value)
+        if self.new_start_time.value:
+            _check_datetime("new_start_time", self.new_start_time.value)
+        if self.new_end_time.value:
+            _check_datetime("new_end_time", self.new_end_time.value)
+
+        gctx = _get_gcal(ctx)
+        events = gctx.events
+        cal_id = self.calendar_id.value or gctx.default_calendar_id
+        event = events.get(calendarId=cal_id, eventId=self.event_id.value).execute()
 
         # Update only if a new value is provided
         if self.new_summary.value:
@@ -211,7 +661,7 @@ class ModifyGoogleCalendarEvent(Component):
         if self.new_participants.value:
             event['attendees'] = [{'email': participant} for participant in self.new_participants.value]
 
-        updated_event = service.events().update(calendarId=cal_id, eventId=self.event_id.value, body=event, sendUpdates='all').execute()
+        updated_event = events.update(calendarId=cal_id, eventId=self.event_id.value, body=event, sendUpdates='all').execute()
         self.modified_event_id.value = updated_event['id']
 
 
@@ -235,11 +685,151 @@ class DeleteGoogleCalendarEvent(Component):
 
     def execute(self, ctx) -> None:
 
-        service = ctx["service"]
-        cal_id = self.calendar_id.value if self.calendar_id.value else "primary"
+        _check_event_id(self.event_id.value)
 
-        service.events().delete(calendarId=cal_id, eventId=self.event_id.value).execute()
-        self.deletion_status.value = {"status": "Event deleted successfully."}
+        gctx = _get_gcal(ctx)
+        events = gctx.events
+        cal_id = self.calendar_id.value or gctx.default_calendar_id
+
+        events.delete(calendarId=cal_id, eventId=self.event_id.value).execute()
+        self.deletion_status.value = "Event deleted successfully."
+
+
+@xai_component()
+class BatchGoogleCalendarOps(Component):
+    """
+    A component that creates, modifies and deletes many events using batched requests.
+
+    Operations are grouped into batches of up to 50 sub-requests, so N operations take
+    roughly N/50 HTTP round-trips instead of N.
+
+    ## Inputs
+    - `creates` (list, optional): Events to create. Each item is a dict with `summary`, `start_time`, `end_time`
+      and optionally `description`, `location` and `participants`.
+    - `modifies` (list, optional): Events to modify. Each item is a dict with `event_id` and any of the fields
+      accepted by `creates`; only the provided fields are changed.
+    - `deletes` (list, optional): IDs of the events to delete.
+    - `calendar_id` (str, optional): The ID of the calendar to operate on. Defaults to "primary" if not provided.
+
+    ## Outputs
+    - `results` (list): One dict per operation, in input order, with `operation`, `event_id` and `error` keys.
+      `error` is None for successful operations.
+
+    ## Requirements
+    - An authenticated Google Calendar service must be present in the context.
+    """
+    creates: InArg[list]
+    modifies: InArg[list]
+    deletes: InArg[list]
+    calendar_id: InArg[str]
+    results: OutArg[list]
+
+    BATCH_LIMIT = 50
+
+    def execute(self, ctx) -> None:
+
+        gctx = _get_gcal(ctx)
+        service = gctx.service
+        events = gctx.events
+        cal_id = self.calendar_id.value or gctx.default_calendar_id
+
+        # Reject malformed specs before any request is sent.
+        for index, spec in enumerate(self.creates.value or []):
+            _check_event_spec(f"creates[{index}]", spec)
+        for index, spec in enumerate(self.modifies.value or []):
+            _check_event_id(spec.get('event_id'))
+            for field in ('start_time', 'end_time'):
+                if spec.get(field):
+                    _check_datetime(f"modifies[{index}].{field}", spec[field])
+        for event_id in self.deletes.value or []:
+            _check_event_id(event_id)
+
+        ops = []
+        for spec in self.creates.value or []:
+            request = events.insert(calendarId=cal_id, body=_build_event_body(spec), sendUpdates='all')
+            ops.append(('create', None, request))
+        for spec in self.modifies.value or []:
+            event_id = spec['event_id']
+            request = events.patch(calendarId=cal_id, eventId=event_id, body=_build_event_body(spec), sendUpdates='all')
+            ops.append(('modify', event_id, request))
+        for event_id in self.deletes.value or []:
+            ops.append(('delete', event_id, events.delete(calendarId=cal_id, eventId=event_id)))
+
+        results = [None] * len(ops)
+
+        def callback(request_id, response, exception):
+            index = int(request_id)
+            operation, event_id = ops[index][0], ops[index][1]
+            if response:
+                event_id = response.get('id', event_id)
+            results[index] = {
+                "operation": operation,
+                "event_id": event_id,
+                "error": str(exception) if exception is not None else None
+            }
+
+        for offset in range(0, len(ops), self.BATCH_LIMIT):
+            indices = range(offset, min(offset + self.BATCH_LIMIT, len(ops)))
+            batch = service.new_batch_http_request(callback=callback)
+            for index in indices:
+                batch.add(ops[index][2], request_id=str(index))
+            try:
+                batch.execute()
+            except Exception as e:
+                # The whole batch request failed; report it against every operation it carried
+                # that the callback did not already record, and keep going with later batches.
+                for index in indices:
+                    if results[index] is None:
+                        results[index] = {"operation": ops[index][0], "event_id": ops[index][1], "error": str(e)}
+
+        self.results.value = results
+
+
+@xai_component()
+class BulkCreateGoogleCalendarEvents(Component):
+    """
+    A component that creates many events in parallel using a shared thread pool.
+
+    Each event is inserted by a separate worker over the pooled HTTP session, so the total wait
+    is close to the slowest single insert rather than the sum of all of them. The pool size is
+    read from the `GCAL_WORKERS` environment variable (default 16).
+
+    ## Inputs
+    - `events` (list): Events to create. Each item is a dict with `summary`, `start_time`, `end_time`
+      and optionally `description`, `location` and `participants`.
+    - `calendar_id` (str, optional): The ID of the calendar where the events will be created. Defaults to "primary" if not provided.
+
+    ## Outputs
+    - `results` (list): One dict per event, in input order, with `event_id` and `error` keys.
+      `error` is None for successfully created events; a failed insert does not stop the others.
+
+    ## Requirements
+    - An authenticated Google Calendar service with credentials (as set by `AuthenticateGoogleCalendar`) must be present in the context.
+    """
+    events: InCompArg[list]
+    calendar_id: InArg[str]
+    results: OutArg[list]
+
+    def execute(self, ctx) -> None:
+
+        # Reject malformed specs before any event is created.
+        for index, spec in enumerate(self.events.value):
+            _check_event_spec(f"events[{index}]", spec)
+
+        gctx = _get_gcal(ctx)
+        session = gctx.session
+        cal_id = self.calendar_id.value or gctx.default_calendar_id
+        url = f"{CALENDAR_API_URL}/calendars/{quote(cal_id, safe='')}/events"
+
+        def insert(spec):
+            try:
+                response = session.post(url, params={'sendUpdates': 'all'}, json=_build_event_body(spec))
+                response.raise_for_status()
+                return {"event_id": response.json()['id'], "error": None}
+            except Exception as e:
+                return {"event_id": None, "error": str(e)}
+
+        self.results.value = list(_get_executor().map(insert, self.events.value))
 
 
 @xai_component()
@@ -257,7 +847,7 @@ class ListGoogleCalendars(Component):
 
     def execute(self, ctx) -> None:
 
-        service = ctx["service"]
+        service = _get_gcal(ctx).service
         calendar_list = service.calendarList().list().execute()
         self.calendars.value = calendar_list
 
@@ -282,7 +872,7 @@ class GetCalendarDetails(Component):
 
     def execute(self, ctx) -> None:
 
-        service = ctx["service"]
+        service = _get_gcal(ctx).service
         calendar_details = service.calendars().get(calendarId=self.calendar_id.value).execute()
         self.details.value = calendar_details
 
@@ -314,8 +904,8 @@ class QuickAddGoogleCalendarEvent(Component):
 
     def execute(self, ctx) -> None:
 
-        service = ctx["service"]
-        result = service.events().quickAdd(calendarId=self.calendar_id.value, text=self.query.value).execute()
+        events = _get_gcal(ctx).events
+        result = events.quickAdd(calendarId=self.calendar_id.value, text=self.query.value).execute()
         self.event_id.value = result.get('id', '')
 
 
@@ -346,8 +936,8 @@ class SearchGoogleCalendarEvents(Component):
 
     def execute(self, ctx) -> None:
 
-        service = ctx["service"]
-        result = service.events().list(
+        events = _get_gcal(ctx).events
+        result = events.list(
             calendarId=self.calendar_id.value,
             q=self.query.value,
             timeMin=self.time_min.value,
@@ -381,8 +971,8 @@ class MoveGoogleCalendarEvent(Component):
 
     def execute(self, ctx) -> None:
 
-        service = ctx["service"]
-        result = service.events().move(
+        events = _get_gcal(ctx).events
+        result = events.move(
             calendarId=self.source_calendar_id.value,
             eventId=self.event_id.value,
             destination=self.destination_calendar_id.value
@@ -414,12 +1004,15 @@ class UpdateGoogleCalendarEventAttendees(Component):
 
     def execute(self, ctx) -> None:
 
-        service = ctx["service"]
-        cal_id = self.calendar_id.value if self.calendar_id.value else "primary"
-        event = service.events().get(calendarId=cal_id, eventId=self.event_id.value).execute()
+        _check_event_id(self.event_id.value)
+
+        gctx = _get_gcal(ctx)
+        events = gctx.events
+        cal_id = self.calendar_id.value or gctx.default_calendar_id
+        event = events.get(calendarId=cal_id, eventId=self.event_id.value).execute()
         # Update the attendees list
         event['attendees'] = [{'email': email} for email in self.attendees.value]
-        updated_event = service.events().update(calendarId=cal_id, eventId=self.event_id.value, body=event).execute()
+        updated_event = events.update(calendarId=cal_id, eventId=self.event_id.value, body=event).execute()
         self.updated_event_id.value = updated_event.get('id', '')
 
 
@@ -447,7 +1040,7 @@ class ExtractEventFromJsonString(Component):
 
     def execute(self, ctx) -> None:
 
-        data = json.loads(self.json.value)
+        data = _json_loads(self.json.value)
         self.summary.value = data['summary']
         self.start_time.value = data['start_time']
         self.end_time.value = data['end_time']
@@ -0,0 +1,81 @@
+import datetime
+
+from gcalendar_components import _TokenRefresher
+
+
+class FakeCredentials:
+    """Stands in for google.oauth2 Credentials; records refreshes instead of calling OAuth."""
+
+    def __init__(self, expires_in=None):
+        self.expiry = None if expires_in is None else _utcnow() + datetime.timedelta(seconds=expires_in)
+        self.refreshes = 0
+
+    def refresh(self, request):
+        self.refreshes += 1
+        self.expiry = _utcnow() + datetime.timedelta(seconds=3600)
+
+
+def _utcnow():
+    return datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+
+
+def _refresher(credentials, ttl=12 * 60 * 60):
+    import time
+    return _TokenRefresher(credentials, deadline=time.monotonic() + ttl)
+
+
+def test_timer_armed_before_token_expiry():
+    refresher = _refresher(FakeCredentials(expires_in=3600))
+    refresher.start()
+    try:
+        assert refresher._timer is not None
+        assert 3600 - _TokenRefresher.LEAD_TIME - 5 <= refresher._timer.interval <= 3600 - _TokenRefresher.LEAD_TIME
+    finally:
+        refresher.stop()
+
+
+def test_timer_armed_without_token():
+    credentials = FakeCredentials()
+    refresher = _refresher(credentials)
+    refresher.start()
+    try:
+        assert refresher._timer is not None
+        assert refresher._timer.interval == _TokenRefresher.RETRY_DELAY
+        assert credentials.refreshes == 0
+    finally:
+        refresher.stop()
+
+
+def test_refresh_skipped_when_token_still_fresh():
+    credentials = FakeCredentials(expires_in=3600)
+    refresher = _refresher(credentials)
+    try:
+        refresher._refresh()
+        assert credentials.refreshes == 0
+        assert refresher._timer is not None
+    finally:
+        refresher.stop()
+
+
+def test_refresh_when_due_reschedules_from_new_expiry():
+    credentials = FakeCredentials(expires_in=60)
+    refresher = _refresher(credentials)
+    try:
+        refresher._refresh()
+        assert credentials.refreshes == 1
+        assert refresher._timer.interval > 3000
+    finally:
+        refresher.stop()
+
+
+def test_no_timer_after_stop():
+    refresher = _refresher(FakeCredentials(expires_in=3600))
+    refresher.stop()
+    refresher.start()
+    assert refresher._timer is None
+
+
+def test_no_timer_past_deadline():
+    refresher = _refresher(FakeCredentials(expires_in=3600), ttl=600)
+    refresher.start()
+    assert refresher._timer is None